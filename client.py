@@ -27,7 +27,7 @@ The client should *not* output anything to the standard output, only to the afor
 import socket
 import argparse
 from ec import curve_secp256r1
-from common import p, g, dh_hash_pub, debug_log, HOST, dh_gen_priv
+from common import P_MPZ, G_MPZ, to_mpz, mpz_from_bytes, dh_hash_pub, debug_log, HOST, dh_gen_priv, powmod, PLEN, recv_exact, write_keys
 
 parser = argparse.ArgumentParser(prog="server.py", description="server for DH/ECDH key exchange")
 parser.add_argument("-p", "--port", required=True)
@@ -40,38 +40,32 @@ PORT = int(args.port)
 
 def ecdh(s: socket.socket):
     c_priv, c_pub = curve_secp256r1.generate_keys()
-    pub_enc = curve_secp256r1.encode_pub(c_pub)
+    pub_enc = curve_secp256r1.encode_pub_compressed(c_pub)
     s.sendall(pub_enc)
-    data = s.recv(1024)
-    s_pub = curve_secp256r1.decode_pub(data)
+    data = recv_exact(s, len(pub_enc))
+    s_pub = curve_secp256r1.decode_pub_compressed(data)
     shared = curve_secp256r1.point_mul(c_priv, s_pub)
-    debug_log(args, curve_secp256r1.hash_pub(shared))
-    with open("client.priv", "w") as f:
-        f.write(str(c_priv))
-    with open("client.pub", "w") as f:
-        pub_dict = dict(x = c_pub[0], y = c_pub[1])
-        f.write(str(pub_dict))
-    with open("client.shared", "w") as f:
-        f.write(curve_secp256r1.hash_pub(shared))
+    shared_hash = curve_secp256r1.hash_pub(shared)
+    debug_log(args, shared_hash)
+    pub_dict = dict(x = c_pub[0], y = c_pub[1])
+    write_keys("client", str(c_priv), str(pub_dict), shared_hash)
 
 def dh(conn: socket.socket):
     with conn:
         c_priv = dh_gen_priv()
-        c_pub = pow(g, c_priv, p)
-        conn.sendall(c_pub.to_bytes(8192, "big"))
-        data = conn.recv(8192)
-        s_pub = int.from_bytes(data, "big")
-        shared = pow(s_pub, c_priv, p)
-        debug_log(args, dh_hash_pub(shared))
-        with open("client.priv", "w") as f:
-            f.write(str(c_priv))
-        with open("client.pub", "w") as f:
-            f.write(str(c_pub))
-        with open("client.shared", "w") as f:
-            f.write(dh_hash_pub(shared))
+        c_priv_mpz = to_mpz(c_priv)
+        c_pub = powmod(G_MPZ, c_priv_mpz, P_MPZ)
+        conn.sendall(c_pub.to_bytes(PLEN, "big"))
+        data = recv_exact(conn, PLEN)
+        s_pub = mpz_from_bytes(data)
+        shared = powmod(s_pub, c_priv_mpz, P_MPZ)
+        shared_hash = dh_hash_pub(shared)
+        debug_log(args, shared_hash)
+        write_keys("client", str(c_priv), str(c_pub), shared_hash)
 
 with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
     s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
     s.connect((HOST, PORT))
     if args.ec:
         ecdh(s)
@@ -1,8 +1,19 @@
 import hashlib
 import secrets
+from pathlib import Path
+
+try:
+    import gmpy2
+except ImportError:
+    gmpy2 = None
 
 p = 0xffffffffffffffffc90fdaa22168c234c4c6628b80dc1cd129024e088a67cc74020bbea63b139b22514a08798e3404ddef9519b3cd3a431b302b0a6df25f14374fe1356d6d51c245e485b576625e7ec6f44c42e9a637ed6b0bff5cb6f406b7edee386bfb5a899fa5ae9f24117c4b1fe649286651ece45b3dc2007cb8a163bf0598da48361c55d39a69163fa8fd24cf5f83655d23dca3ad961c62f356208552bb9ed529077096966d670c354e4abc9804f1746c08ca18217c32905e462e36ce3be39e772c180e86039b2783a2ec07a28fb5c55df06f4c52c9de2bcbf6955817183995497cea956ae515d2261898fa051015728e5a8aaac42dad33170d04507a33a85521abdf1cba64ecfb850458dbef0a8aea71575d060c7db3970f85a6e1e4c7abf5ae8cdb0933d71e8c94e04a25619dcee3d2261ad2ee6bf12ffa06d98a0864d87602733ec86a64521f2b18177b200cbbe117577a615d6c770988c0bad946e208e24fa074e5ab3143db5bfce0fd108e4b82d120a92108011a723c12a787e6d788719a10bdba5b2699c327186af4e23c1a946834b6150bda2583e9ca2ad44ce8dbbbc2db04de8ef92e8efc141fbecaa6287c59474e6bc05d99b2964fa090c3a2233ba186515be7ed1f612970cee2d7afb81bdd762170481cd0069127d5b05aa993b4ea988d8fddc186ffb7dc90a6c08f4df435c934063199ffffffffffffffff
 g = 2
+PLEN = (p.bit_length() + 7) // 8
+
+# p and g converted once, so repeated gmpy2.powmod calls skip the int -> mpz conversion
+P_MPZ = p if gmpy2 is None else gmpy2.mpz(p)
+G_MPZ = g if gmpy2 is None else gmpy2.mpz(g)
 
 HOST = "127.0.0.1"
 
@@ -10,14 +21,49 @@ def debug_log(args, msg):
     if args.debug:
         print(msg)
 
+def write_keys(prefix: str, priv: str, pub: str, shared: str):
+    Path(f"{prefix}.priv").write_text(priv)
+    Path(f"{prefix}.pub").write_text(pub)
+    Path(f"{prefix}.shared").write_text(shared)
+
 def dh_hash_pub(pub: int) -> str:
     hex_str = hex(pub)[2:]
     ascii_bytes = hex_str.encode('ascii')
     return hashlib.sha256(ascii_bytes).hexdigest()
 
+def to_mpz(i: int):
+    if gmpy2 is None:
+        return i
+    return gmpy2.mpz(i)
+
+def mpz_from_bytes(data: bytes):
+    if gmpy2 is None:
+        return int.from_bytes(data, "big")
+    # mpz.from_bytes only exists in gmpy2 2.2+
+    from_bytes = getattr(gmpy2.mpz, "from_bytes", None)
+    if from_bytes is None:
+        return gmpy2.mpz(int.from_bytes(data, "big"))
+    return from_bytes(data, "big")
+
+def powmod(base: int, exp: int, mod: int) -> int:
+    if gmpy2 is None:
+        return pow(base, exp, mod)
+    return int(gmpy2.powmod(base, exp, mod))
+
 def dh_gen_priv(p=p):
     return secrets.randbelow(p - 2) + 2
 
+def recv_exact(sock, n: int) -> bytes:
+    buf = bytearray(n)
+    view = memoryview(buf)
+    off = 0
+    while off < n:
+        got = sock.recv_into(view[off:])
+        if not got:
+            raise EOFError(f"connection closed after {off} of {n} bytes")
+        off += got
+    return bytes(buf)
+
 def byte_length(i):
     return (i.bit_length() + 7) // 8
 
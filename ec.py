@@ -3,8 +3,18 @@
 
 
 import secrets
-from typing import Tuple, Union
+from typing import List, Tuple, Union
 import hashlib
+from ec_comb import SECP256R1_COMB
+
+try:
+    import ec_core
+except ImportError:
+    ec_core = None
+
+
+COMB_TEETH = 8
+
 
 class Curve:
     """
@@ -14,14 +24,18 @@ class Curve:
     - G: The base (generator) point of the curve.
     - n: The order of the curve.
     - h: The cofactor of the curve.
+    - beta, lam, glv_basis (optional): The GLV endomorphism phi(x, y) = (beta * x, y) = lam * (x, y)
+      and a short basis ((a1, b1), (a2, b2)) of the lattice used to split scalars.
+    - comb (optional): A precomputed fixed-base comb table for G (see _comb_table).
 
     The class implements the following methods:
     - point_add(p, q): Add two points on the curve.
     - point_mul(k, p): Multiply a point by a scalar.
+    - point_mul2(k1, p, k2, q): Compute k1 * p + k2 * q.
     - generate_keys(): Generate a private key and a public key for the Elliptic Curve Diffie-Hellman (ECDH) key exchange.
     """
 
-    def __init__(self, p, a, b, G, n, h):
+    def __init__(self, p, a, b, G, n, h, beta=None, lam=None, glv_basis=None, comb=None):
         """
         Inintialize the Elliptic Curve with the given parameters.
         """
@@ -31,56 +45,182 @@ class Curve:
         self.G = G
         self.n = n
         self.h = h
+        self.beta = beta
+        self.lam = lam
+        self.glv_basis = glv_basis
+        self._comb = comb
 
-    def point_add(self, p, q) -> Union[None, Tuple[int, int]]:
+    def _point_double_jac(self, p) -> Union[None, Tuple[int, int, int]]:
         """
-        Add two points on the curve.
+        Double a point given in Jacobian coordinates (x = X/Z^2, y = Y/Z^3).
+
+        Uses the fast a = -3 formulas when the curve allows it (secp256r1 does).
 
         Args:
-            p (tuple[int, int]): The first point.
-            q (tuple[int, int]): The second point.
+            p (None | tuple[int, int, int]): The point in Jacobian coordinates.
 
         Returns:
-            None | tuple[int, int]: The result of the addition of the two points over the curve.
+            None | tuple[int, int, int]: The doubled point in Jacobian coordinates.
+        """
+        if p is None:
+            return None
+
+        X, Y, Z = p
+        if Y == 0:
+            return None
+
+        YY = (Y * Y) % self.p
+        ZZ = (Z * Z) % self.p
+        S = (4 * X * YY) % self.p
+        if self.a == self.p - 3:
+            M = (3 * (X - ZZ) * (X + ZZ)) % self.p
+        else:
+            M = (3 * X * X + self.a * ZZ * ZZ) % self.p
+
+        rx = (M * M - 2 * S) % self.p
+        ry = (M * (S - rx) - 8 * YY * YY) % self.p
+        rz = (2 * Y * Z) % self.p
+
+        return (rx, ry, rz)
+
+    def _point_add_jac(self, p, q) -> Union[None, Tuple[int, int, int]]:
+        """
+        Add two points given in Jacobian coordinates.
+
+        The second point is usually affine (Z = 1), which saves a few multiplications (mixed addition).
+
+        Args:
+            p (None | tuple[int, int, int]): The first point in Jacobian coordinates.
+            q (None | tuple[int, int, int]): The second point in Jacobian coordinates.
+
+        Returns:
+            None | tuple[int, int, int]: The result of the addition in Jacobian coordinates.
         """
         if p is None:
             return q
         if q is None:
             return p
-    
-        px = p[0]
-        py = p[1]
-        qx = q[0]
-        qy = q[1]
 
-        if (px == qx) and (py != qy or py == 0):
+        X1, Y1, Z1 = p
+        X2, Y2, Z2 = q
+
+        Z1Z1 = (Z1 * Z1) % self.p
+        U2 = (X2 * Z1Z1) % self.p
+        S2 = (Y2 * Z1 * Z1Z1) % self.p
+        if Z2 == 1:
+            U1 = X1
+            S1 = Y1
+        else:
+            Z2Z2 = (Z2 * Z2) % self.p
+            U1 = (X1 * Z2Z2) % self.p
+            S1 = (Y1 * Z2 * Z2Z2) % self.p
+
+        H = (U2 - U1) % self.p
+        r = (S2 - S1) % self.p
+        if H == 0:
+            if r == 0:
+                return self._point_double_jac(p)
             return None
 
-        if (p == q):
-            s1 = (3*pow(px, 2, self.p) + self.a) % self.p
-            s2 = pow(2*py, -1, self.p)
+        HH = (H * H) % self.p
+        HHH = (H * HH) % self.p
+        V = (U1 * HH) % self.p
 
-            s = (s1 * s2) % self.p
+        rx = (r * r - HHH - 2 * V) % self.p
+        ry = (r * (V - rx) - S1 * HHH) % self.p
+        rz = (Z1 * H) % self.p if Z2 == 1 else (Z1 * Z2 * H) % self.p
 
-            rx = (pow(s, 2, self.p) - 2*px) % self.p
-            ry = (s*(px - rx) - py) % self.p
-            
-            return (rx, ry)
-        else:
-            s1 = (qy - py) % self.p
-            s2 = pow(qx - px, -1, self.p)
+        return (rx, ry, rz)
+
+    def _to_jac(self, p) -> Union[None, Tuple[int, int, int]]:
+        """
+        Convert an affine point to Jacobian coordinates.
+        """
+        if p is None:
+            return None
+        return (p[0], p[1], 1)
 
-            s = (s1 * s2) % self.p
+    def _to_affine(self, p) -> Union[None, Tuple[int, int]]:
+        """
+        Convert a point in Jacobian coordinates back to affine coordinates (one modular inversion).
+        """
+        if p is None:
+            return None
+
+        X, Y, Z = p
+        z_inv = pow(Z, -1, self.p)
+        z_inv2 = (z_inv * z_inv) % self.p
+
+        return ((X * z_inv2) % self.p, (Y * z_inv2 * z_inv) % self.p)
+
+    def _to_affine_batch(self, points) -> List[Union[None, Tuple[int, int]]]:
+        """
+        Convert many points in Jacobian coordinates to affine coordinates with a single modular inversion
+        (Montgomery's simultaneous inversion trick).
+
+        Args:
+            points (list[None | tuple[int, int, int]]): The points in Jacobian coordinates.
+
+        Returns:
+            list[None | tuple[int, int]]: The points in affine coordinates.
+        """
+        zs = [pt[2] for pt in points if pt is not None]
+        if not zs:
+            return [None] * len(points)
+
+        # acc[i] = zs[0] * ... * zs[i]
+        acc = [zs[0]]
+        for z in zs[1:]:
+            acc.append((acc[-1] * z) % self.p)
+
+        inv = pow(acc[-1], -1, self.p)
+        z_invs = [0] * len(zs)
+        for i in reversed(range(1, len(zs))):
+            z_invs[i] = (inv * acc[i - 1]) % self.p
+            inv = (inv * zs[i]) % self.p
+        z_invs[0] = inv
+
+        result = []
+        z_inv_iter = iter(z_invs)
+        for pt in points:
+            if pt is None:
+                result.append(None)
+                continue
+            X, Y, _ = pt
+            z_inv = next(z_inv_iter)
+            z_inv2 = (z_inv * z_inv) % self.p
+            result.append(((X * z_inv2) % self.p, (Y * z_inv2 * z_inv) % self.p))
+
+        return result
+
+    def point_add(self, p, q) -> Union[None, Tuple[int, int]]:
+        """
+        Add two points on the curve.
 
-            rx = (pow(s, 2, self.p) - (px + qx)) % self.p
-            ry = (s*(px - rx) - py) % self.p
+        Args:
+            p (tuple[int, int]): The first point.
+            q (tuple[int, int]): The second point.
 
-            return (rx, ry)
+        Returns:
+            None | tuple[int, int]: The result of the addition of the two points over the curve.
+        """
+        return self._to_affine(self._point_add_jac(self._to_jac(p), self._to_jac(q)))
 
     def point_mul(self, k, p) -> Tuple[int, int]:
         """
         Multiply a point by a scalar.
 
+        Uses the Montgomery ladder with Jacobian coordinates and a single modular inversion at the end.
+        The scalar is padded to a fixed length (k + n or k + 2n, so its top bit is always bit n.bit_length()),
+        which gives the same sequence of one addition and one doubling per bit for every scalar.
+        This is not a constant-time guarantee: Python's and GMP's big-int arithmetic is not constant-time.
+
+        Curves with a GLV endomorphism (secp256k1) instead split k into two half-length scalars and use point_mul2,
+        which halves the number of doublings but is not constant-time. secp256r1 has no such endomorphism,
+        so ECDH over it (including the variable-base shared-secret multiplication) always uses the ladder.
+
+        The ladder runs in the compiled `ec_core` module when it is available.
+
         Args:
             k (int): The scalar.
             p (tuple[int, int]): The point.
@@ -88,16 +228,162 @@ class Curve:
         Returns:
             tuple[int, int]: The result of the multiplication of the point by the scalar over the curve.
         """
+        if p is None or k <= 0:
+            return None
+
+        if self.beta is not None:
+            k1, k2 = self._glv_decompose(k)
+            return self.point_mul2(k1, p, k2, ((self.beta * p[0]) % self.p, p[1]))
+
+        # Every point has order n (cofactor 1), so adding multiples of n does not change the result
+        k %= self.n
+        if k == 0:
+            return None
+        nbits = self.n.bit_length()
+        k += self.n
+        if k.bit_length() == nbits:
+            k += self.n
+
+        if ec_core is not None:
+            return ec_core.point_mul(self.p, self.a, k, p[0], p[1], nbits + 1)
+
+        # The top bit (bit nbits) is always set: start from r0 = p, r1 = 2p
+        r0 = self._to_jac(p)
+        r1 = self._point_double_jac(r0)
+
+        for i in reversed(range(nbits)):
+            if (k >> i) & 1:
+                r0 = self._point_add_jac(r0, r1)
+                r1 = self._point_double_jac(r1)
+            else:
+                r1 = self._point_add_jac(r0, r1)
+                r0 = self._point_double_jac(r0)
+
+        return self._to_affine(r0)
+
+    def _glv_decompose(self, k) -> Tuple[int, int]:
+        """
+        Split a scalar for the GLV method.
+
+        Args:
+            k (int): The scalar.
+
+        Returns:
+            tuple[int, int]: Signed scalars (k1, k2) of about half the bit length of n with k = k1 + k2 * lam (mod n).
+        """
+        (a1, b1), (a2, b2) = self.glv_basis
+        k %= self.n
+
+        # Rounded divisions c1 = round(b2 * k / n), c2 = round(-b1 * k / n)
+        c1 = (2 * b2 * k + self.n) // (2 * self.n)
+        c2 = (-2 * b1 * k + self.n) // (2 * self.n)
+
+        k1 = k - c1 * a1 - c2 * a2
+        k2 = -c1 * b1 - c2 * b2
+
+        return (k1, k2)
+
+    def point_mul2(self, k1, p, k2, q) -> Union[None, Tuple[int, int]]:
+        """
+        Compute k1 * p + k2 * q with interleaved (Shamir's trick) double-and-add.
+
+        Args:
+            k1 (int): The first scalar, may be negative.
+            p (tuple[int, int]): The first point.
+            k2 (int): The second scalar, may be negative.
+            q (tuple[int, int]): The second point.
+
+        Returns:
+            None | tuple[int, int]: The resulting point.
+        """
+        if k1 < 0:
+            k1 = -k1
+            p = None if p is None else (p[0], (self.p - p[1]) % self.p)
+        if k2 < 0:
+            k2 = -k2
+            q = None if q is None else (q[0], (self.p - q[1]) % self.p)
+
+        # table[b1 | b2 << 1] = b1 * p + b2 * q
+        pq = self._point_add_jac(self._to_jac(p), self._to_jac(q))
+        table = [None, p, q] + self._to_affine_batch([pq])
+
         r = None
-        a = p
+        for i in reversed(range(max(k1.bit_length(), k2.bit_length()))):
+            r = self._point_double_jac(r)
+            pt = table[((k1 >> i) & 1) | (((k2 >> i) & 1) << 1)]
+            if pt is not None:
+                r = self._point_add_jac(r, self._to_jac(pt))
+
+        return self._to_affine(r)
+
+    def _comb_spacing(self) -> int:
+        """
+        Return the number of scalar bits covered by one tooth of the fixed-base comb.
+        """
+        return -(-self.n.bit_length() // COMB_TEETH)
+
+    def _comb_table(self) -> List[Union[None, Tuple[int, int]]]:
+        """
+        Build (once) the fixed-base comb table for the base point G.
+
+        T[b] is the sum of 2^(spacing * i) * G over all bits i set in b, stored in affine coordinates.
+
+        Returns:
+            list[None | tuple[int, int]]: The comb table with 2^COMB_TEETH entries.
+        """
+        if self._comb is not None:
+            return self._comb
+
+        spacing = self._comb_spacing()
+
+        # teeth[i] = 2^(spacing * i) * G
+        teeth = [self._to_jac(self.G)]
+        for _ in range(COMB_TEETH - 1):
+            t = teeth[-1]
+            for _ in range(spacing):
+                t = self._point_double_jac(t)
+            teeth.append(t)
+        teeth = self._to_affine_batch(teeth)
 
-        while k > 0:
-            if k & 1:
-                r = self.point_add(r, a)
-            a = self.point_add(a, a)
-            k = k >> 1
+        table = [None]
+        for b in range(1, 1 << COMB_TEETH):
+            hi = b.bit_length() - 1
+            table.append(self._point_add_jac(table[b ^ (1 << hi)], self._to_jac(teeth[hi])))
 
-        return r
+        self._comb = self._to_affine_batch(table)
+        return self._comb
+
+    def _mul_fixed_G(self, k) -> Tuple[int, int]:
+        """
+        Multiply the base point G by a scalar using the fixed-base comb method.
+
+        Needs only `spacing` doublings and at most `spacing` mixed additions, but building the table costs far more
+        than one point_mul, so it only pays off once the table exists (see generate_keys).
+
+        Not constant-time: columns whose index b is 0 skip the addition, and the first steps on the empty
+        accumulator are no-ops, so the running time depends on the bits of k.
+
+        Args:
+            k (int): The scalar.
+
+        Returns:
+            tuple[int, int]: The point k * G.
+        """
+        table = self._comb_table()
+        spacing = self._comb_spacing()
+        k %= self.n
+
+        r = None
+        for col in reversed(range(spacing)):
+            r = self._point_double_jac(r)
+            b = 0
+            for i in range(COMB_TEETH):
+                b |= ((k >> (col + spacing * i)) & 1) << i
+            if b:
+                x, y = table[b]
+                r = self._point_add_jac(r, (x, y, 1))
+
+        return self._to_affine(r)
 
     def generate_keys(self) -> Tuple[int, Tuple[int, int]]:
         """
@@ -107,7 +393,10 @@ class Curve:
             tuple[int, tuple[int, int]]: The private key and the public key.
         """
         priv = secrets.randbelow(self.n - 1) + 1
-        pub = self.point_mul(priv, self.G)
+        if self._comb is not None:
+            pub = self._mul_fixed_G(priv)
+        else:
+            pub = self.point_mul(priv, self.G)
         
         return (priv, pub)
     
@@ -124,6 +413,38 @@ class Curve:
         y = int.from_bytes(pub[byte_len:], "big")
         return (x,y)
 
+    def encode_pub_compressed(self, pub: Tuple[int, int]) -> bytes:
+        """
+        Encode the public key in the compressed SEC1 form: a parity byte (02 or 03) followed by x.
+        """
+        byte_len = (self.p.bit_length() + 7) // 8
+
+        x, y = pub
+        return bytes([2 + (y & 1)]) + x.to_bytes(byte_len, "big")
+
+    def decode_pub_compressed(self, pub: bytes) -> Tuple[int, int]:
+        """
+        Decode a public key in the compressed SEC1 form by solving y^2 = x^3 + ax + b for y.
+
+        The square root is computed as (y^2)^((p + 1) / 4), which requires p = 3 (mod 4).
+
+        Raises:
+            ValueError: If the encoding is malformed or x is not the coordinate of a point on the curve.
+        """
+        byte_len = (self.p.bit_length() + 7) // 8
+        if len(pub) != byte_len + 1 or pub[0] not in (2, 3):
+            raise ValueError("invalid compressed public key")
+
+        x = int.from_bytes(pub[1:], "big")
+        y2 = (x * x * x + self.a * x + self.b) % self.p
+        y = pow(y2, (self.p + 1) // 4, self.p)
+        if x >= self.p or (y * y) % self.p != y2:
+            raise ValueError("public key is not a point on the curve")
+
+        if (y & 1) != (pub[0] & 1):
+            y = self.p - y
+        return (x, y)
+
     def hash_pub(self, pub: Tuple[int, int]):
         x, _ = pub
         return hashlib.sha256(x.to_bytes((self.p.bit_length() + 7) // 8, "big")).hexdigest()
@@ -153,4 +474,24 @@ curve_secp256r1 = Curve(
     ),
     n=0xffffffff00000000ffffffffffffffffbce6faada7179e84f3b9cac2fc632551,
     h=0x01,
+    comb=SECP256R1_COMB,
+)
+
+
+curve_secp256k1 = Curve(
+    p=0xfffffffffffffffffffffffffffffffffffffffffffffffffffffffefffffc2f,
+    a=0x00,
+    b=0x07,
+    G=(
+        0x79be667ef9dcbbac55a06295ce870b07029bfcdb2dce28d959f2815b16f81798,
+        0x483ada7726a3c4655da4fbfc0e1108a8fd17b448a68554199c47d08ffb10d4b8,
+    ),
+    n=0xfffffffffffffffffffffffffffffffebaaedce6af48a03bbfd25e8cd0364141,
+    h=0x01,
+    beta=0x7ae96a2b657c07106e64479eac3434e99cf0497512f58995c1396c28719501ee,
+    lam=0x5363ad4cc05c30e0a5261c028812645a122e22ea20816678df02967c1b23bd72,
+    glv_basis=(
+        (0x3086d221a7d46bcde86c90e49284eb15, -0xe4437ed6010e88286f547fa90abfe4c3),
+        (0x114ca50f7a8e2f3f657c1108d9d44cfd8, 0x3086d221a7d46bcde86c90e49284eb15),
+    ),
 )
@@ -0,0 +1,269 @@
+"""
+Precomputed fixed-base comb table for the secp256r1 base point, used by `ec.Curve._mul_fixed_G`.
+
+SECP256R1_COMB[b] is the sum of 2^(32 * i) * G over all bits i set in b (8 teeth, spacing 32), in affine coordinates.
+Shipping it as a literal means a key generation does not have to rebuild the 256 points in every process.
+
+Generated with:
+$ python3 -c "from ec import Curve, curve_secp256r1 as c; print(Curve(c.p, c.a, c.b, c.G, c.n, c.h)._comb_table())"
+(the output was reformatted to hex, one point per line)
+"""
+
+SECP256R1_COMB = [
+    None,
+    (0x6b17d1f2e12c4247f8bce6e563a440f277037d812deb33a0f4a13945d898c296, 0x4fe342e2fe1a7f9b8ee7eb4a7c0f9e162bce33576b315ececbb6406837bf51f5),
+    (0x7fe36b40af22af8921656b32262c71da1ab919365c65dfb63a5a9e22185a5943, 0xe697d45825b636249f09f40407dca6f174b3d5867b8af212d50d152c699ca101),
+    (0xe35798220cedc02a608548c24aa7358f830895e4fccc3ac216fc51ff8101e6e4, 0x700f948e1f433a2df3e4b396768a3299f0570bedc523e6efaad2b99852c392c3),
+    (0x0fa822bc2811aaa58492592e326e25de29493baaad651f7e90e75cb48e14db63, 0xbff44ae8f5dba80d6f4ad4bcb3df188b34b1a65050fe82f5e41124545f462ee7),
+    (0x300a4bbc89d6726fb257c0de95e02789e96c98fd0d35f1fa93391ce2097992af, 0x72aac7e0d09b46447f1ddb25ff1e3c6f5bb1eeada9d806a5aa54a291c08127a0),
+    (0x14cb5692606a4a62a9cad33b680a7daae0d3eb336c224571d6e260f8ee4039a0, 0x53098cfa3e1e4663878487ed997a9a3b5205ef8d8039927cfe93d3159d83bc01),
+    (0xa5ab9e10958f1608c22c48c5ffea17c1585a137ef5c4ad4230368cb6d945111e, 0xd3ebc6118b1aa09a629e17ebad0648f446ed771c49a10f77c34a47b8785b4ed9),
+    (0x4a5b506612a677a657880b3a18a2e902e9a521b074ca0141a84aa9397512218e, 0xeb13461ceac089f1c42604fbe1627d40626db15419e26d9d0beada7a4c4f3840),
+    (0x418d68dea064219700d1a0a5fd208dfb48f9c1875e98c12dc761c1fecc049786, 0x5d7b26f6a5ba6dd4435639622ef8d32017429c50c16caad0481eef5551b50759),
+    (0x0781b8291c6a220ac342967aa815c8575e52c4144103ecbcf9faed0927a43281, 0x690cde8df015159397b2a14f1291643488f80eeee54a05e35a8343ceeac55f80),
+    (0x57f62eeca7b5d4fb54a0fe5274647ebe82d789a6dd561becc52c00cae38e3820, 0x5e5ff8bf89bfe2ad60e9c067efea8f480d300594ec356dceaa60759d48f81460),
+    (0x91c821d488e9843c27035d2627caa74754d5dad9289944395920d7b0fa3289d5, 0xdb7aecc78f879f44919adc3734938dac7b7df6ea0408ebade130dead9aa8a566),
+    (0x06f0afdb90422d81c9c6f5415bf70c35eddf9c6c7e1c792ebc499ee7c6fae6d7, 0x77f9e8f73f9804c47bab8955dde6464641a7cf1aaf7ae617214f0ad04dbc747a),
+    (0xbc07bb82d6536c0292052d44bcdf6567f0698ff75e4ec9655d01a765c96900d8, 0xeb165f9c1d90902aa17bf29fc7b19a1e635f210ec2e7ba735fe58ccf83762c71),
+    (0xe018aaa22086a46c269843f16b47957bd86848c84760c41eaf972b45f2159928, 0x383f4db07f10ee50f2fe8863ba0dbc83d36d88b34fed7bb921a0332299698420),
+    (0x447d739beedb5e67fb982fd588c6766efc35ff7dc297eac357c84fc9d789bd85, 0x2d4825ab834131eee12e9d953a4aaff73d349b95a7fae5000c7e33c972e25b32),
+    (0xef9519328a9c72ffddc6068bb91dfc60ef7fbd2b1a0a11b713949c932a1d367f, 0x611e9fc37dbb2c9bc1ee9807022c219c23183b0895ca1740196035a77376d8a8),
+    (0xe42c3142a822a85667aa472a8aee6cbadd78a219ffa77f1e9dda03e10af44892, 0x8ad034d0c011817a21774e51032c4f8ebd464186d00f7365bee346fef20db957),
+    (0x4ee298bbb9a7112b8930de364b3cf7fbca9b1154adf9e4301f969276d94b1a05, 0x2cbbf338463a6a4ce47c8ac6b38a628c79a86b84fb972962c7551f59caba1c4a),
+    (0x550663797b51f5d87dea6482e11238bf2936df5ec6c9bc36cae2b1920b57f4bc, 0x157164848aecb8510afa40018d9d50e59fb3d576dbdefbe144ffe216348a964c),
+    (0xeb5d7745b21141eaa2e8f483f43e43917ccd84e70d715f26e48ecafffc5cde01, 0xeafd72ebdbecc17b0990e6a158006cee85f22cfe2844b645cac917e2731a3479),
+    (0xb942b33ff0fe9dfe3774353a724a8b0ac1e70873221aa5229f95a5aba7dde09f, 0x0b909273a61e51efd6c52e034fab6ae5ae3e0880c2beaa26e9601ac334fc7653),
+    (0xd3e89accd85f6d65e36f1c449288e474ee59a5741500d33791ba25b51a780592, 0xa4f12b40a5dc116355942307841fb007565c81ca92e2f47a0f5590ecd8871d87),
+    (0x529dc0b0700ba968b6cbd28cda5f8abdb286a3b3f6d4b375298ad9c1471bd072, 0x9b5426c7c49bc6a79ab4c9831e39fce699685e9cbc3089da44672963aa8c414a),
+    (0x1240b6fd5eec701372aabf6eadc757cac2b3b386ba8303d21fe36ffcab0c3e88, 0xe54f16a7214b70d948a48000f43cc68fb9f4ab882c136832106308a81a9310a3),
+    (0x0a70f85c5ec68bbf7f25bf81fdaa2b5f8bf2981741d13f39d9d5e5c80fee06c8, 0x63228d59848ef239383e025c20a2e32f5d40405183421b3df2cfc922d5e4d954),
+    (0x771f45752bc76af777a91d71f7ea3bdb46b57e189eec8a3ebaf7d30752ffcef3, 0x32e4114942161a6ec375b4342615a6d0ef6a285153df5f8fd918b424fce5c8b5),
+    (0x81cf67211f24fb5c2acc9e80e778c5d5057848f679a1e862fa268bc15543f33f, 0xef55045a45b0a71a0d41954d92e85c539650c9c89851bb7e87656e350f94bce2),
+    (0xdb5254718579357aa6c44b758003a37e2fe6a994cad74dc7ea5d651d9ef0f09e, 0x91b67e6372c4ad3e4335fde232d4ecebbe207a55b0bb56478732a3e32ed0f0b1),
+    (0xcd20145af8bff7eb7ce355b7c417b614f29e7e82ad8cee06cdedcb0dab018c7e, 0xd4619f15cb510c0910475df1c00f55deef934b9575459f98aec6a202e5457eb3),
+    (0xe3ddb10a97b14c6ee52b3f50578625563f68c71c8473875d7ff55fc4152b9a0e, 0xd3b0f1bf728361775739291741c3def2d1d4f5ddd269de873675857468dba9f2),
+    (0x8a535f566ec73617f5622df4373713269e4c35874afdf43aaee9c75df7f82f2a, 0x0455c08468b08bd737e02819085a92bfcde533864c8c7669c5f9a0ac223094b7),
+    (0x47b54b049d565a0c9b6f997e68f1f6f140bf984b5eecb7039bf49908374e4457, 0xe7afea2915a4a7df77368e750feb1cc14e2a6ea3776f48bb241301c369900111),
+    (0x06bada7ab77f82765050a949b6cdc279f9a4bf62876dc4440c0a6e2c9477b5d9, 0x5b476dfd0e6cb18a427d49101366eb70debd8a4b7ea1070fc8b4aed1ea48dac9),
+    (0x29d6274e86dbc8f8d43b2ebc722425cc176324e40626c5d703220fb8d961d446, 0x6c16b472a58169482b1cfe87bac647319c8c1cbfe1239ea558185a44c08d73db),
+    (0x5f68c836059ffd234b032745f09c4be222278fa5b82a9f20e2753cb123a81ffb, 0x0639e57e9e109af70c84bfb334925367b2b1552cf9fb8d66bf3ae3691dbf8f8d),
+    (0x3b5b03e66fea06099e18931e3ed6dfca66a664470859a19ed8218845c60c4684, 0x76f1e0c838e14ddc2cd1ca07f35c826395ffd11264477877d8bc19b5a9d7edbb),
+    (0x2c1a2336cb79ea5a9ebd9fa2edf0f22e62b730a14b11663fa3d21037611d1a41, 0x2e1c47701dfc32e7146454ffb587c2e92c2988be729cb7fe294b5675ac53b363),
+    (0x76e96b4689ef69a23d622057d9d59f46be9522aa0561f51e8722658c67429e4d, 0xcf218959f705e3191575c0cb27f9fb8875b78e2215ff899316aa0650b797faed),
+    (0x3e29864e8a2ec90829a751b1ae23c5d84d54606812d66f3b7c5c3e44278c340a, 0x239b90ea3dc31e7e1f150e68e322d1edad1744c4765bd780142d2a6626dbb850),
+    (0x191eb33a05d45c5aa96c9e4b121421de85b40dee6858d44bcf15dc9c87617f0e, 0x8a9365ff592282a1f3eb80dd45e9654ff245c57b28ee6e02c9c16e10199cf43b),
+    (0x820f4dd949f72ff7dbcab759f8862ed4305dde6709776f8e78c416527a53322a, 0x140406ec783a05ec1b481b1b215c14d375be5d937b4e8cc46cc544a62b5debd4),
+    (0xff29dc0fb3cd1c0fb8635f9a8c6615b01370d12fea3f501a44f65f507e0e3190, 0xc43831f33439a42224dd659509b8e6b614def0abeecc62e307f8a15d738114f6),
+    (0xe21f15f31f2b6b79e1ef732acbf28253e7f0390c1cc1e2e542293cdf93501899, 0x4a3fc23cbc052d4438c94cb14d24ee97c056b494726b5a08cfc0f97cd622619a),
+    (0xf361d7062c10d86c8720d1960b854da95c5093ba652f6cd5a30935f760d54267, 0x2c990dbb6b183cfb44bdb2fac3d3516d8a18ce4b2f7d40c8d11a3d27723b99e4),
+    (0x5991daa221cd1c8d87704e324ceb95a3e2dbe559ce200b86ed303f4c96480ca6, 0xde5d58968ce1431a0efb4bea1dd427e89fe5ed7dd3ab365920a4bdad75c04ee0),
+    (0x33fef524e062a8c2303e35f06b6cb7b9918e1fb4c03eb194af31d989a52342b3, 0x0a5b4caad84dbd4e519ad6ff20859bd2067cfb0df5162c74692a4fbe512e5bc0),
+    (0xff25f55a2c214cd923fe7442010729acef8bf285dfd6c3f34193640bfbb7f12d, 0x94f114d38a40510000c15ba774a58d771a08ebc72ab82b74d77bf411f30f0fc8),
+    (0x1b9d594e63ae46a6e0443b938edc0d1331c6f0569f7768191fd07ab7d0a62b2c, 0xed16ba54ed96c8e1473ab21101683ceffb52863b9a58ab515ab358fcc14453e5),
+    (0xc3948bd495baf610861b8e4c1898ead9e498612fcd9222632641769d29ba369a, 0xbe92ada7218a7b612f5b7f8094743717a2b8624abe0a3da8b529a79b3ff24345),
+    (0xa15475573ef44b43fbe20b4762b812a72dbfbc52ef2d93e1ef977470fd943a71, 0x384d56278c4b8a43b5115ad492efaf4fd0702163b7e40a72f18068cb89bc18d0),
+    (0x8d84f41903b2b318ae21f1b4ecf21b69ca274a6db4cacf2380d58211c0b0755e, 0x15bcd7d06953fd62c98ecbf6ec26c110c73b5fdfd91762a0c518f8949f10418f),
+    (0x4a014325e27f462a03ce1e41808ec0ed60eb5c88c6471595c877db08061457fe, 0xb069f7e02f381bb947f1271441cda791206d4beb662743c77961a1cda4fba4fc),
+    (0xca7ee91544e182ab1cbf27b36121b9774787ec66395463746e6f4859cb87dea8, 0x0d4c001670f14a3d4cd025842fc8c2a34225339a6d5fdb9a40bd566d7f985b5b),
+    (0xd96633a7570e8f0f8a8c8b106b4f6a92cbe46247ad3055b99a89a4cc9b6d8676, 0x4d144dea9825b9fdd7533270f64c3358215d4ce640ba4a72d1fda6e8e8b04cc1),
+    (0x1577aca85af864ec563f9fba9d67ff491b08f73d4cd0c836a3baaf1d66fdc380, 0x78286cc9138e5ef8e30612058e1d9252cdbe96b5a8e5ec0ae61a8c7e0c0b7b43),
+    (0xb08c91a385a5d1eb4ebccda4ad1e3bb3f26390c703bb91800f8364c4253bcbf0, 0xb8fe20c13158a73c6fd29d96c502fbe039bd97d62ba0101b60dc9158b643475c),
+    (0x9645c64a532189d37c6bdf85a8787924d3c72ba593f52b68fc0ddf3be0106368, 0xffb683e63260f488bf4ec9f6e0ed1cc09b7e75e16e82dc9158d3cc9b824e2771),
+    (0xa9c3643e39848086346fab7979a87eefeaa11d49881d43428821c701a4f0c81b, 0x76cdf40c11e94cefa48cf15dbd4aa53c0d287400e1f9d4bae040a053f6c6e053),
+    (0x97c0af3a660402f45a2288492a7516ca9184493f4ce753c83f0230417ef30e41, 0xc6d1b0f9cb5623fdb487dbb92032d1814f22360ce707a0b2d0db8ce78a23e934),
+    (0xdb93a6b1eae5181887bccbe90f21c2c93dc6f57f775a0fe28746f4832bc5c755, 0x7675343a5db3c2a565fe92b6deac962d2791bf5473972e83f5754a37a87aa88a),
+    (0x7e941cefd88c31941e25c80810c24e9e6fd6234ad14b1a555c2ce4441c77336e, 0x7d3bcf9d2948048d835e6cd4d4956f066256b1bfdb055169bfa7a9bae4b9453f),
+    (0xa57ddaa355b9ed411d6cbef129af296df3c2f9c40891878c8248075318064104, 0x5bcfd6f3d7f746dfc125bb25ca13fa1245057fcf197db90d4f47c7f1903a1cdf),
+    (0xa6d39677a78492762736ff8344315fc596439591a3c6b94a6cf20ffb313728be, 0x674f84749b0b881666b8babd2d27ecdf824a920c2284059bf2bab833c357f5f4),
+    (0x4e769e7672c9ddad31855f7db8c7fedb74e02f080203a56b2df48c04677c8a3e, 0x42b99082de8306631ec0057206947281fb9ae16f3b9122a5a4c36165b824bbb0),
+    (0x507b542a65dbb34ae9e180a67586e3c3426e2f715a89065340b11c79bb162b85, 0x5eb5701ed11a51d6ca383ce7d338ecde33520333301369c1225f912ae489b8ad),
+    (0x62d4a49f7696fcf5f2f80e3e3e1a841ce8d7b16415065b98490e66bcfbcbc0c3, 0xd18b33ebd347d33256193ecbf36fa83e9033768477305b1486eddee7f521f731),
+    (0x78878ef61c6ce04d7fdc1ca008a1c478d1f89e799c0ce1316ef95150dda868b9, 0xb6cb3f5d7b72c321de53142c12309def6ace570ebde08d4f9c62b9121fe0d976),
+    (0x0c88bc4d716b1287595c5220812ffcae5b82dd5bd54fb4967f991ed2c31a3573, 0xdd5ddea3f3901dc618d1b5b39c04e6aa7c8181f4df2564f33a57bf635f48aca8),
+    (0xaa59e783ff476ef03bcfb88d8fa8a5979d11bdca400cfa698b030feafb696d7b, 0x30a12aad30e77dd1da2c96d0d831450e2a4147fa5c0aba02fbad341388f5a016),
+    (0xe3ddf1b7b498993d7d021b57e9c9c2a290e7efc3ece43efedfa412e530076ed0, 0x283833a8a60ce85f8490e46777227a7b959131adae7c855e5b955c48846b4d7e),
+    (0xce6d933a4ad70bcc7657711b76fd08725682157eb65437ecfb5a3d222fb3062c, 0xa88399605d2c8bb7d1edb57b9a834dd30fda9930d4111c9da9cebba1fc3e65c1),
+    (0x790ecf8695ea9febd43a75032992882073758b21ad6c392388bc6c8d8c4150cc, 0xe340d641d87decf6f444c49a9d6239f60f7a900f9f51de1559a580f71bfb5292),
+    (0xb05e35aa414dd6bea2c053e4e869a58eff199a093a50d3ac1ebb28ac1026b033, 0x47270f9c6646039ad7e45688c5ae69dec25c0899f8427d60fbcb4c4a6754449f),
+    (0x22bc5020d2f8bae84ebc714416b20242fab939d7703913a80dfab50ae872889a, 0x616222e478e64c2eac67692caef98a9b3c2cd39e3ef21012abeaaae69d713946),
+    (0xfaa43bed93239bc602790b8c48a3fbb661948cc6f068c865ffcdcc28b6a8a95d, 0xd21a75f1026921ca1388e9e243482e7d5f83ca7a3e4708bd9774704677a8fe3d),
+    (0xfd3bcf2d7f94bbb6f3deb3513ab26d77a9c4ebbc8ba6bbcf7549f1b1a15bbae6, 0xada514fed97112dbba4ccb8ef8de5d37bad3e545d2f4fdabfa8344d746fe3ddc),
+    (0xf28dc88b5144598eefb612744bbf5a9fabcaeada80217643017fa5e28bcf4dbf, 0x1a2429408249b59be1913ca6671dd0813098725673df56d72fd4905eb384a585),
+    (0x4290db0b47c9e92592c6a768f4eb6e646cfe750ab21ac825da3983931f70723f, 0xb5d01e333374c163263bead1f2ebcd3c64aa8ad3c8971f1af9d2fb88413464c5),
+    (0x68f344af6b317466efe0a423083e49f343a0a28c42ba792fe96a79fb3e72ad0c, 0x31b9c405f8540a20604ed93c24d67ff3668bfc2271f5c626cdfe17db3fb24d4a),
+    (0x4052bf4b6f461db9663c62c3edbad7a00d1a10144ec39c28d36b4789a2582e7f, 0xfecf4d5190b0fc61862be6bd71d70cc8e724f33999bfcc5b235a27c3188d25eb),
+    (0x5583dafaaa83c35c9341bc0912dde90da41a773e74d2b11163fec45f15a27295, 0xe096722b49b67cd60af26be52c6e92a6cf73a836c427f2ecbc93ae0b05f406f4),
+    (0x38641e4c5172ddf2bda236244f5f705051d353e992448ec8f4b1ad5300aef6e0, 0x28ac3017eee3a756efb765537bb9888dbaf02e13042f9b7fd076b5ae0dafe306),
+    (0x1eddbae2c802e41a123202a8f62bff7aafdf5cc08526a7a474346c10a1d4cfac, 0x43104d86560ebcfc0c45f45273db33a036e06b7e4c7019178fa0af2dd603f844),
+    (0xb48e26b484f7a21c0a4a46fb6aaf363a66b0de3225c4744b9615b5110d1d78e5, 0xfac015404d4d3dab64131bcdfed6f668c004e4048b7b0f9806ebb0f621a01b2d),
+    (0x4fa4a1ea884d880e429dd48f377756fc1960edaf10203d11ff8d09c072600e54, 0x3a6681db426f03fe7e8849f335364b6a4b9a578cae16e60f7fa9eaf18d24ad69),
+    (0xe00f53af57add1cf9a3bfb576bc20d7fef92aac0a7621aa362427d348fa9f0a4, 0x15b8c5b7ae5822e91873e2cb9e7fa3d96dbadf7065870acdaa0914209a8e182b),
+    (0x69a5b074cac8251dd1609f4feeb4beacbf667bea84d5959a6b53bf21593d097f, 0x454f241c1daa41286840955e685d723166a6aebcd420d3e0612d65315318ecb3),
+    (0xabd4c85f526bde8f63749ea0948e7dc2e139639fa18b743b8d3e6d40a5d67e8a, 0x475baed2f64a622e63feba54a83f25069a9c0ddd67ed8673731da7942d812dfe),
+    (0xe9bc4fe4109a2589637899ce70fa959cf7accaedf911ec641aa70ad1b40aab96, 0x20efcfbb8b08213e4997cc24bae3365e2941c273bb65d9be7bcce0d01bf979e4),
+    (0x5e12f3898de947875efd04d688a2ea3b64da38dc6877584cdde6c1b0bdd6fa57, 0xcc9c71a86f430c30bff58f5412104d900220a96532c58ce1822dc6f34c229e61),
+    (0x4d88f26e5d12fc47f8ba56503433145066fb03767760329169a3f7af146a91dd, 0x2f4241dd39ad0a5180660eb41c1bfc1071fc3d27d84f6dc452e87a6fde1d8482),
+    (0xf5d4040440b36824593303db16b45eab89d02e3ab6030005cea18fed5da65e89, 0x90eaf4b0005e4955e2cb53ab3735f704b6680f4aa0f8db738e62c398b6e6ca16),
+    (0x2090fa8e117da9620aaa6a0a821e5b58e8e44ea4ce4824bb4ea9bf09d030702a, 0x984bd632ec32f258ebb4408c0393f96baf0a7e970b4e74721b68c30680902901),
+    (0x3d45853a29fb81a62ee9f02661b05022e05eff00b42511bc807d9af81159f10e, 0x4e4de334a80a831187211449edfc125e82111a06515a90e0a6b9c16ef75bc3a9),
+    (0x0ac9835f0e6155faeb3df8bf9d6b4a9b60ff39edff736545270a098d637d797d, 0xd6882b263d00d534d8ac7b195c6872b2fa24f7333fe89b0850c04b69640bc0e9),
+    (0x389eff2638ec3ddd69479cbc3f92d7241fb825a3cd9a2912e00523230236a83d, 0x5e1b21c931ea1ac9cfd0310cb7b0af9e113a50c591f3a0dee9ffea6c1eb367c1),
+    (0x9419acf5e6f3ba6ab5f5fb4714db328c78ddc159ea0dfe34da6e2f0648aceff5, 0x565a90711b427e8608a1f515ee3174a1473be3d3f91bdb7bb19cd157c66c1b27),
+    (0x3af2420900c9bc2641a41f2ab0578f7c46fc6cc686db595a71db5c74863def2f, 0x6013da0e4ab472ab39b1f3b2df2af3437870f3a9b6070f59134233fdb3c9ab1a),
+    (0xb7f41bbef19e37989a143ff7a833145efad93fe2f8f15faca4ab1856f319ca96, 0x9d86b0cc0a92fe7051bed9bedef04692fbe87b9ffd3b7782e71b2d4788fba40d),
+    (0x94a875b99ef8f7f39e0ab0cfc4383c7093b1c84ffe90a0f6e4269dbe901d3434, 0xca5520762e3f918588d04ff3a59e41564426e75124c1f8a17c54e5277bd07e21),
+    (0x3fbfbd74bc2625f909ec2b468e7e89c3130ee8f7ccbf8eb6c6c3baae3f32bef2, 0x21531773751967901409df32eb6fc065bb3271ff3cf0d52988502a08b27173d1),
+    (0xf883c4ab576b2b287e9d484ba9325717b5f1a270410e3f2893eb1d710da1427c, 0x6086f208488ab1d0b461efe8dd9dec7aaee70132560fab548471e07515b0cc94),
+    (0x3841166eca2c0e18ebb176e7d72435ffe42d2ea24320bec38a9b3774d41345eb, 0x84d9c1a689f4ced9203c98cbca99fe017518195ce329d0df9c27a301d372be35),
+    (0xbfd0718059e44b7129d692e0a20bcd3f5378515ce3acd77ca7f47395b789034e, 0x4710396375deaf0447e891ec07e9c6e843428c8199f9141a92cd3e156733f199),
+    (0x383707d06e2f531d48369a111fca7f340354736587490006e240342607888c81, 0x287ff1929b236f7a8a4a5b65cdb6f94dca0b8578c9d5ef32dc6a82149f7d10dc),
+    (0xfd98525d8fb2fa61dffff48fb15fda955fb1fbc9af70db2d886878ca48c1555e, 0x93840d780f6b2d619569dffba223c95e9bab3b2a270697839a481e7557f0c9a8),
+    (0xb241aa941d926d0f1394cbdc17b23442b7adca0c3a4708faeaaaa5d823baeb04, 0x85aa7eed21b920e41dde0dee46ba6568ee7534c9e4b48a02da7549f51de2521d),
+    (0x0869ec0d495431ad06136e7f91e8b82b892d0a814ecb2af2348857eabaf91228, 0x5572895c9b7675a070a00076265eb81acb47adca823c9b5154fa49c42e051cdf),
+    (0x1283033bde733f89b2dcbd1f58d5a91a065977932c06a25a9d1adf6096c14e8f, 0x549c0eaa34dd7d5f84af4665a635c7bee8b071577d383846b4020e0e9bbd6a2d),
+    (0xa2ebf469e6f31bb325d5e27d2f48f49fa8266dc10d5c06caf29fb08fe86e02ab, 0x27bebd8c4432235d391b9654002d76f6cb92f44b363f04f786ae97d90382a8eb),
+    (0x6a25fb201b4084ce8a404541b1f23d69561d30f51dc2d82e7b3068d03765581e, 0x5a0aebfc19cfb424f5763393d06a40071e15941a5cf443d550180e1b60206329),
+    (0x62778f7452b8fccaafe88b1ee0950a67a581a768c73a541aa2d545dae529a049, 0xe155b2f81ae910884e4cbe60553a776c5d727f5a6e882c2444bb1bfa0b8483fc),
+    (0xfc9aa3cfd1c608d1aa9cebc16013b8bafbae3d63b71b2f045d84a3a31b207a93, 0x34ab0e432bb637da6db0b1cd85ac096c26152558da16b20c1e3f596ccf8cd72d),
+    (0x4f117894c1752bb75455fbcb0b17775bfe5180802a6a470aa9f4f5c112c953e4, 0xab3b615535ffd9dce26ae66a01da56c90dde356f22c3ec1c5b5e49de544a3be7),
+    (0x4751fe00adbacc804f11ee65a3106421dd3c9aad01f60a8121ad037bc94f4326, 0xe83d7d4f1fa0772b200697f311a422f6fa8bd14471d43f65e4683589d3c2917e),
+    (0x2298506c51c0a6fc8b32c8bb5af99278ecfda9fdc44627deca907bff59b21469, 0xfef3434a4c45bbd78916aceca5809f67d903a0c9bc8dcdbc2227244e9d7bfc5f),
+    (0xaca1b2fa9b855f0e44f0646e52f84fde78346549076108b712749619c5332d4d, 0x30fc315c7d37f6e44162bf6f7731c386341dd5515cb0077a9f40edd1bb5acc3e),
+    (0xdc9823e48af95af26d440b9b26ea9a300bd79c64133b52f507c6577ebe224934, 0xb2656a22043c56ddb648efdb55572efdcaedc3a2cd6f6b4ff3dcb38a951a08eb),
+    (0xd3559359c9729043121738aae23c4d47e70143a545ddcbcc24c2e7a27cab3106, 0x7aa2269895edb5867bdde51ffbf9ab22f09ef638d8c94522d0abcedd5f6e4215),
+    (0x0d5caba28f6039597cb9b4864835f583d41592d988a132f3c7e05f58530e8727, 0xcb814263597d997bad213d44eb862fbe75d0638a0751fedfb97c361d7d850a76),
+    (0x537e0faaaea80a6b61cd936d8f8d3ad4e2b23452ee80d7185e2a21f585fba82b, 0x98ff32e10476e6db197c7be0c9e7c92dad915586e9a48461e8a1913b65c03360),
+    (0x9c4c8c6b29bb4956f20b6904294f6172a90c803b32ab611556131598f8d734ca, 0xf837ca9f6437cec7264bcaa0f99a6339403fc2d51aaf4a8f72523cbca3443e3c),
+    (0x8384f799ae3a0ddcd41f0cfacf4eebdf0fc3a28f1186bde23bb7808415685448, 0x76570d52aa489e306c3bceb338e0e1cec2f5d30f833d3476f4ee653f10b4f451),
+    (0x5af8869591fd763cf0d16be247a4c94d2b07aeb1a9e0d3c4b7aeab38a38218cf, 0xb21a41036ed4de655099b9c8d34e284a10d130ab61ebe016053ab9142a9da273),
+    (0x7104ded97cd3977c656e05982ebff5ce014ff0a9555e9ca4940f3648f8e85a02, 0x3b4a1d7f8c3faa7ef8c14705b14a50bf0627be3c0830e76d9a4c05126385dfe7),
+    (0xb751a5367958e14d0e6df4e4cc8037337b98a2bb47bc1e4f84b1e14be6a868a0, 0x91eb562a61468d103141411ac695ddd6effa615ae16ed05ef925771b5b9871b7),
+    (0x68f6b8542783dfeeeb5b06e70ce08ffefd75f3fa01876bd86a703f10e895df07, 0xcbe1feba92e40ce6fbc8044dfda45028cf5293d2f310bf7f90c76f8a78712655),
+    (0xcf6b116fa174d4d3024cd871d984505727f187b97eda11d3fd4c1473c0c1ce9f, 0xc2de1fa1b6bfc532c79088192ab7b709364bc65823f12526d300b23fd279352f),
+    (0xd0b2f94d2f420109230f729f2250e927fc82ef0b6acea274e998ceea4396e4c1, 0x971459828b0719e57db2636658954e7a10b838f8624c3b454305adddb38d4966),
+    (0x76f210afa9d19ea8e2b1f3ee5a01c10e93978b4da76e5bf364549b3dd93f535c, 0xf34b31ceb3a040cf84132d01e6280f919f989031483487baf04aca7ac4264d57),
+    (0x93b3ce8df075ec6cc360c19a5975d2fd566bf7faf8735fb175cec1ffeee8cb7e, 0x268c55b1e6dfab8e4a1d862f6dac86b017ec17c1d1c39345718b6e47815d65ce),
+    (0x201173f5f5d8be2cb2fb47fde178f6449c8838dfa23b8b1bb535fd34cffcaf2d, 0x8dac7611afe2ae9a17b6206c756b5779165d69eaf856b514485e1c8d9968eeee),
+    (0x77aaebabc911375c18975ae2a11506507603024661eda89e0c55f223dbdf389d, 0xf34aaca7fb60cd489d288103e28735228aa8f7402dde44e4edae9ad12fe056e6),
+    (0x77b0d0c5f137d62f7bb27826949edfb78fec77f2a9178a0bbc7bcc7308bdf594, 0x40c07b4755f452b10189ca26eab66f18133edfbd966cda495add7b4b88f8a9ea),
+    (0x961610004a866abac2d5cba4f234068757f2929e53d0b8764bd6b72623369fc9, 0x7acb9fadcee75e442cf1f2438fe5131c69ab197d92ddcb2449997bcd2e407a5e),
+    (0x6d78f612686e5aeaf608ee91af71ed7f7e38e207d3fbb145fb5f7e26b34983b1, 0x2980bd5a6d242b89006f6d32f4fe56a98607cb372748ba3b2f9d2e63607e751e),
+    (0x24eb9acca333bf5ba60d880f6f75aaeaf57f0c917aea685b254e839423d2d4c0, 0x69f891c5acd079cc743125f88bac4c4dfeef9341c51a6b4fe3de4ccb1cda5dea),
+    (0x7afb3d4fb50c2893c6d198de03fa5c24e8f20516b78a63ac6384ab743dba87e7, 0x36009a3ad6668beb08a7cc67552c1f31aac22a0e4faa9acce4d418b93a4cf320),
+    (0x4667ebb9d2c76536e8a7b747651c98348c3f4a314e74381309a16e3bb34d794f, 0x2d5c1ac738d06677fc2d460955f59432d021bc8da08df8431f6884fab8a887ab),
+    (0x25279d0378812b43504b972687679b85e2e6d3b50406e1ce1d348841faecb3e4, 0x92d01b0bf08564a749e88336d630da82f0184a5bb002bcf57e32900956676779),
+    (0x1ab172c7b101b4f69f5d99a2c06a66736800b8a884a462f79460f46a36cfa9e8, 0x885ae5024f34681691c6eebbdfaa5eaa0b9aca14ed13bc1ff699c7035321c59c),
+    (0x38611618d97e432401b3dfd4a4c0cbd255b5a898cbf1b409dbdeb29dc9757170, 0x7e7d03d3b8f4136221d8f50853c47b8960941f4ebc20e2c6f3ea377457bee79e),
+    (0xbd6058b07b81568e83fb2d63c62cd05550d19d86abc96fedcc38452ef202481a, 0xf78e1fbef8467e379ee514e409ef7dd9c51419ed83f257d4628271f170737bb6),
+    (0xca270c0ba31d0a51c4151215661f3bbeef414a60d24c26d1045ef431339fe5ce, 0x0920500e29cbeee5e2a468e21b6552cc5da2412a55b9ae920bddc41d89d02271),
+    (0x1d96882ce4d5882cd634f48d38675522e6325d2679cc84d18272ef3692873d50, 0x35c125a19f50539e4bcb643096de39853c33b393d43110a37f0b53565c7604c9),
+    (0xab25034f49504379997d426565d64e562c3c19bc16bfc3ddbad5f61f8c720a67, 0x53cad2bd0d44fbaad64055551dfbd10bbef8d14a12e86d681f6297f61410392e),
+    (0x4e3c677a0d8e4b517f2e2c69bef2376631cce9a5bcf946ff60d14d0e0d25ca56, 0x71094b90a70684b1411651737e8b1d461a2389c8d0391ca8a7c52eca6bb0d0ce),
+    (0x48a9d631f60c851ca81f6685ca976e8bde2a1e0ed3bac85876f6c64666554187, 0x9c7778375c1a48c75603885c68db8031588c234ff7934cbd95a81b38336936e6),
+    (0x791851e23680a202609275b04c80bd1ef0190802d4ab7632fc9c7afb8709b816, 0xf1ef50838d9e3b7c3c993d167c507f6053b13f9cacb207b30b4fd3fb5899ef09),
+    (0xc34b4a3053e2cc9aa1f27672403efce0b87460699022c4cbf426fe060ad2fe5c, 0x52de5611e37c6ea391a140b98bff74a69906218b134638067e49b3abd0e57d9f),
+    (0xc1ee712fafb30e899f5d367aba1de923bfc3ead077a11d29ad1e58c9e28b1b92, 0x9b4a54bc696a7139b36b5fd018cba903b1d36d2754b5c1c304886f3475876ac6),
+    (0x41cdad11c29564f871bb07b46ad4bc18d69dda22b863af57db84065d519e0427, 0xfeeec42cf3df9d57f477717d5033cca772e4d2b646ba501d7272b74c503cc09b),
+    (0x532de1cf647e46e4f2b8c361453c442ea16130ea97b24f3d435b40ee57186ac4, 0xcb652c2d539889dc45cbeda8f2dfea044e7192ec182eb339faf3c94f64ccd9ef),
+    (0x363b9c747de9e9ed604ca87dbf91842dccaeb5eed5de9a098e6576bbd34c847e, 0x1b42a7c70b1573df1df4b333adec53318ea65e9c7279a59220e28af484919f51),
+    (0xc9bf6f1511a280e55316a4fbe079d281f84a8cad058a3ba9e9ee350d55ef6c3c, 0xcb8de2d920f282f6631d68d7fcd817bab5722bcfd943046477414a7a860e512e),
+    (0x3b9b4f1c3ed70f65ed6350882024de093cbbe8d7609c485fe3cc615186af53ca, 0x906102741a3d863474bad233ecdb4d154add5adc137df53d9c0b92e34e292129),
+    (0xda65930fcb4781494a49989b04b21320c1c05129162247d9120229152374f412, 0x5d96fdddb30413b9e454254f00687bbd3cfce1cfad7fccb6ed96215f69fb4789),
+    (0x66209c6168585ed294a30525e8e3e1336919a9255cfb064220f89c805dee2192, 0x0a244a2ad5882c267b7fa943f320f71fdac80d74f02488240c9043646de12c85),
+    (0xe51f547c5972a107b422d1e7bd6f85147ed031a0e45c2258eee44b35702476b5, 0x1c309a2b25bb1387a62f98b3a9fe9a068ca922ee097c184ea25bcd6fc9cf343d),
+    (0x1123ced96671ea61f2c9f8cc824a9c3f0d6670134afafbaba352a845c6ee75b0, 0x6d8a68382fd8bec74789d01e8b03f8d0ae8a4ac75dda8f0ce2064c2bc4c0426b),
+    (0x20b87b8aa2c4e503c504977708011828b00148833472c98e9295dbeb1967c459, 0xf5c6fa49919776be0d11adef5f69a0441bd539338fe582dd3063175de057c277),
+    (0x39a10292cfd15d0c32b46d0d4303072331c73944625c8dda27326510e418daad, 0xfb83754a71a8271d33f788b208f50113a0ba92f0175f71ee1ef7417699961dea),
+    (0xbe61fbae68229401a3b4c6e60adc727d07f24f18f624c89460ffee0c16898779, 0x39012ba1cd61583768a1116b34e57c7e1b4108e0bc5336ede7c012bf634fe770),
+    (0xeb34ef6f656b250f03349ce181fbacad843d7f20cccfc5a62c8ca159bd26c6ae, 0xa64bff59f0b887049b8875421e49dd7af50639f64ff14d3066e790360c299bce),
+    (0x4832590d8cdca7883c0a7831aae1ae3a0dfaf15d48af3a1a00a5a2c3b7f335bb, 0x0707e099bfec3698d747e700d9875fcc069199d718129bfb9937352decf2985c),
+    (0x06de6b81d14ff204e235cb04edd8d48cce50f2c03dfed107b1a8e69a03541f94, 0xdad5c91cc3977369c00f85a44817fb8600aa7aa4dd87634b5ca05ca3c4600a5e),
+    (0x1ed7d1b9332010b9a454c3fad83faa563876cba1102fad5f8c944e760fd59e11, 0x3a2b03f03217257a52b520f0eb6a2a2405e4d0dcac0cd344a1011a270024b889),
+    (0xd7f0611192ed176af17bbaf7df1000b74f9fbbf4a33802f10b25c598b315365b, 0x0633f1655dc730b94d4ad114833fe7d06479a7fbc3c2c608e6d03f9ee9aed821),
+    (0x15fee545c78dd9f6fc7d229ca0058c3bf330240db58d5a62f20fc2afdf1d043d, 0x4ab5b6b2b8753f81557d9f49461210fb41ef80e5d046ac04501e82885bc98cda),
+    (0x5556c6a33290e994210e59995b3f7f24d9bbbdf1dbf911679cda05e28618edf1, 0x6384a08eb6d666f1e732b3c2a6f5d2c135f67e2ca4034316dfa4617ffd9d9264),
+    (0xceedb9c0e07de03313ca866a1f8ed30fed936a9c03bdeb8db2d37da42dc58892, 0x978e934870cdddcf0d463e119a484a31f329daa70ec7d64c88f742d43e5135b4),
+    (0x93cb902b8ea4a221097b65a79718f64295adebe49378f406c5d60ab48939ca0b, 0xd3b0dc0ae8141b67eeea7c182db584df7c4e4dbbe51424d6f072428c7b6d5fdb),
+    (0xdf895bd38ee47c9b85918af48cfc624b3b6d0ef382b2725cc42bb0bd8e33832b, 0x299c4da5c36963d66a83828d154be8dd819d351a585c96b08bb5d0bbc15185f0),
+    (0xcd651aa7f3cf02082185dc73e13a9610f3fcccf2ac879905ea4c1463289149a5, 0x10dd490fb0ee6067fc590faa3f54042d6a9a3c3928198bbaa481d87446927d66),
+    (0x86699898a60bcd7758e0a73c3879d7d86da147f00d75821e9baf4d7aaac4170a, 0xc0d84aeca4b075f432ca235d2af12355428dede80187f877ae7cd4da598a46eb),
+    (0x939ee1b79e6861cb36dc5ad71a074661867c34597e1eedbe48ced071d35d8953, 0x194a24f2152dae15c617bac67ba8bb79a8796969282822820e5e70eb5b609c5b),
+    (0xa7e3564787b3fac10442464e82a3ef272b9a8ed791f4fb9539f582c5ded33571, 0x971f1ed8b2909721306f746aa59305ff0f3cdd60019da0dd005bad87a367dea6),
+    (0x21121447d054b2962601f683572add8deb6bf1dd975b995d4511c44cb852cdd7, 0x8e96e1cf6534b5a1f04ed2d1af927b356467317be3a79a2af4f6240142cf0265),
+    (0x239e0726e788e9c48df30a42966ff1fa48cebf9b0537352e58adb933af4247b2, 0x4f8a60295f71c539191cbb757e106a1f22272e554e914e8e5c6958a2d79b48b0),
+    (0x13a5bee343d8d04a14d2f6a40a0b44132c80a1102777472025b336a3f7158bea, 0xb455e8a4eb43c09875168f8a26d8258c5da5d14c364957b293b68c5fe4a44502),
+    (0x903bb9ea519859d3695306048b4d91ff3f80547676acaa65640614a3b1ebe50c, 0x5574f2712350281b823dba188ce5fa331df54929390d890093a59e699f5fac7f),
+    (0xf1ae17098c4b59c2a848d319c5f6a0566dba1852ed2e78bef111b2000309488a, 0xfb339802ebd18ac30ce00c9c8529cc2bd7db6879ed484551757d507b881bd57f),
+    (0xde96f184703285cfa5a17e069ffe80e684eeb8e904f7fda9250c5af31fc78e0c, 0x0d6b8ab0fcbef7cb7babf7e2b8bd6d722f6745478724d28ecceabb013fe41e6f),
+    (0x24dab3a122d625c19f1bfedd3bd130b6c0eebac0029194879be634cc19abcaf5, 0xbe1cf505cb9f9e6d8ddae1b50eb9ea81232d3373555042a346ab327cb4206e3a),
+    (0x7329508c8cfd2794a7273058340f393cf1e9810343534d5ae854e0a5cbcdafe6, 0x0971a6ffc40be3cae8e08261694b2061494d5a8f651e2938e715886a538e99cd),
+    (0x4ef9a80e92f1445ea612c437bb38a63010c24d5973f8fcef56643934455d0d81, 0xec8a3ad89ff6732569c3d99097178ba32f62feca0d1dc166a9a648e21ee44719),
+    (0x387518cdaeee4c0e5c1b4412bb10ab9db2bd1a025c9531ce7ce0d6ac90828f9a, 0x777b407cd9e3102d65d54499f174480921f57922bb92be7a87de57ce98f368aa),
+    (0x896fcf1c1a3c51e12696f3ff658b8eaffe8613855c0b259309d92a8ee746eaa6, 0x61ff42c1a4205d2184c50345d6eac1c91cd3c38f610922e68d8e617efc538f16),
+    (0x6de16859f4fcb1e13967127798ffd997f579deb98bf29bb97b741b5d8230a9a6, 0x5b96178769b0beed9b478f3aa150fa0477d3e0f2f4fb138fc6b7a38dea723b7f),
+    (0xd827c8b41584098967515b87faad16d1afa9c66ea5aedbc666d0eecb1d842031, 0x2f661c17c22ecf90fc4d874fd45188d78ea03cabdc28e5bd5e1b7bb1c8a420ed),
+    (0xfb0249aa28a8a8fbb7fbe79e03e042ea3478e062311cb1f3dceafeb7328fb9ef, 0x172f46339c5fbc3e48e514e109aa13a20e540e9f3d15281350b4bb44b8ee1b8b),
+    (0x0b65925199bf4616ca34705224070df57b03cdfef8ffb4a9dd8d54f8a37cfbfe, 0x8e249aeb59b2f313cc31d2bf5e8366aaa45c28fd415ba4f1ce2e30d8ee44254b),
+    (0x60aaa403457c10bc9f9f4b0153f5b5af3b208cda228912258874151d56f93781, 0xdca8e0d715ac62a9e34045fe7c7158c1e4503bb0a743684152a2bda00300cd5e),
+    (0x62a8f8a75e552eaecd1bf7224509733e25953391ca111dd0a423dc889361cf42, 0xbbd935cd493ed75fee3ede744dcca7d6215f2de4a2abc546a6a1a79c4dfb5704),
+    (0x33ae4c04052d79802ededda56cea145c2b4dccba49f109d0228b7867ad8fbf6a, 0xc78a5ac5e945824b715ad94e0495ea86343ed3d830c418f9487e1051df1203af),
+    (0x7ead1e20fecf1d1d4db687f0ee52df5e7d764e91f58543c13680071a8c935e5f, 0x0ca741ed97c7d64599039a8ad51630d51ca6c43fb65bb00a453cb9945fe9a684),
+    (0x05d525aca25ebc68e366206545e70812a5ef3ec0177d8e3d614e1441f45be76b, 0x663c885482ab5457129f80b11e80ea457d5ab00a868bc04c11c3041b916e827a),
+    (0x10a3f54b2ab10678c3db4e2f583f63109037b2f39827ed700ea0ef30c4268106, 0xad2373050da518ef9514515e370e1411d4770a89af1652427097dd2b706e16c5),
+    (0x37fbf41ea1636f3b41d49663401788b353c33faba557050d1f5ba0281c86789a, 0xa9116c70f46a6605c2a5c1736e61b1c6bf50bc02acaa8d5107763b950f7b0609),
+    (0x605a5fd0e650fe2b3a1a550731696b824d8b3c3b504b641a5999001a336f30c4, 0x87004ddca3e4a3610ec6913b0583b20b360522e142ff1bcfe45bcf344624ad94),
+    (0xe35df7ebdb0836b11c54046482e9a1db355100cb8883a49294b476bcb029d3d7, 0x0646fe1719352ce1d697f63e8ddcd14f921bc05b72ef8a862db5a7f56ba5ddb7),
+    (0xe01af14a8e4bd2f7481eaf13d0136ae3e2fb9537d0531de863dfc0b718ac6f86, 0xc0c7bf9e736e1021443cb43f1e03afa9d764a4c692aef32349ee4f9f88f974ec),
+    (0x8254b8684efdcedda4eb06a644c50cb71bed98450514514c72f792d19bb57932, 0x0cba204678462b89adfc9cf1c15aa29f2d48e4ecb3d9561547bb74d9c9dadade),
+    (0x9dfbbb656ac0dc43a3ad44cd375c643c3e790d215e3c47689b0d9abb479f4bfe, 0x611140356c18c02e0ae22c684d70486312294f31de78a5e1da6ffb7955c762ec),
+    (0x0afc214a4dc993c44372a3f58609f93f1b99cc550a936c6b2360d888d96dd1ed, 0x00b80a92d9ca7e1de3e1c378bdec43eda6d44568af2235e2ba08d6c7a6bf396f),
+    (0xff36e487d97937534cc4d7923d0efa7a042dd3d697f4eb7b06750a2ac7ab8183, 0x59006dc6dfc694ff972991813ffebb019773ae266d1706fe104dff634e06e132),
+    (0xebc3d35e8855a59acbbd5f2012ca3c26846730ad139ad48c2ffbcf19dc0b1061, 0x5290bec161ce30304b3c37853fe325890da658f5f8f4be3a18644a975b93e742),
+    (0x3fecd70b3404d5a1c0b00e7c4a1807a1885dd6dfcca526f5e6fad49d3df40f6f, 0x8441556c67ba560477cdb71fb320240754ab18c97155ec7de77bfe486782d8d7),
+    (0x82396be5ff16883f3bd303d3a234c73ff84fbbfbb58c2f9b38694e01e9d78dd4, 0x2a677961aa1981ffba6926ba1aa338dbcad118bd817255a656ecf3fde886df4e),
+    (0x3a758d6195a50c0a8ada939b79786c3a43f076bca69f58c875a1590c05f4cc58, 0xb8891adce54e241cadffad5591fb5cf75985f593ebfe41ad22348461ba2155ef),
+    (0x017cc283ee17d82a5b5a8cba2bebb1062c73fd44092d97be1811517824fc05cd, 0xd71a2864a1ec8caa760eaad5a2ff19e7f16121e889433e441997473042ee8fdb),
+    (0xabf356cc0a43e6fa0971375b6af484f4cabd266e82f2758626f1caf37f42a1bf, 0x1565ca3b0f2635d3cb21fe9915a2316fbaf618fe3a8efac5c7b5039691c5e0f8),
+    (0xea4b209d938edb856fe4c1bdb64daa60a14b4ab5b9659aa101babf6d79fb664d, 0x485c0038caa001b1f01824e4b1e09d854bacded7292af72ee322af733290b2f4),
+    (0xcfb13598da3e40c7c35061516fc3ea5b06591ec999a7318d954e5fa87c092020, 0x66512cbd4e9fce6b0204e321c61599ecb9176be6cc4b15bbb447cc06826f6eb1),
+    (0x743a048fc3a865052f827232efadecb4ac0d2cc05a12f3c8f59ca0416891ea5a, 0xa4394d9e5e165be410a67ed661e77c87a548e7ec11fedb76d0154838f9aa9765),
+    (0xe23bd3cba37060d9198a79b9b08c6b69d5539be9bf4fcb962798852b012ddf9f, 0x9dfd8b3f3212ca5bc429b0b87514abbedf697f4b57091704cc7f52c968a6a401),
+    (0xa2028cc599993f69a604d0ca73af33a794fc7759dc49feee4c82a43884a74d26, 0x19d166cc62c4c70e26fd5fb5f123fe2d97ea28673704942e06d21477733d26c8),
+    (0x56decf3e4ab23d35cb1d3464cd20e76da53341c7fcdeed1a4af25ce1abbfe286, 0xc49eae3844f43b95f9a6bffad463f935ee102be505a43863dd832027e524aafb),
+    (0x7f88fc4e7e0a7bbaf6133dedac45e9f377c0a893b510a24559e60bd88b894f9b, 0x68c635f03997b513f6bf01614bd8deac64ba76155623e6e88c615daa751bb0fd),
+    (0xe5c81e0b0c3c0922998ac40b92eea7b3b1d6f20c166245dd8d15f49de7753698, 0x6591e281a7d62d55405ba189eefb0c072779b4b388a56acdf65ca63385a9e76a),
+    (0x0447f868ae7398d94f4ddce9a887eebc47ce08a19c6baf9548c896d16bd408b4, 0x5f37cceff0fb4cac035c1d08a2a7c433dc935601e15eff33b70895fe9cbaa537),
+    (0x41ab46144f85d8041d5ded4c51e08c2619dc19b91136ee1bf5a4aa87a47c229b, 0x4851764433f9e08dc1c053e73c3ce36720cc8ff42ab68afff02dd1d4738106ca),
+    (0xa176c395ae64d73870e00c7531905283d7768c940d8a6fb01e3081abb7f6be1f, 0x9ebdec88947b45f151ab984b9feeea5c087565ce611fe5069e5850bc1fa3578c),
+    (0xcefb84404c985649faa63b4d24e55c735986356bee9e8acb587c5da0b792fbec, 0xa40c8baf0767a8637b5348a95881270e6204487e79c38de91c20fe34540926df),
+    (0x6194bdd5d50ae58395f962d2067977ff42fc6006ebb3b85e4f0ec8f0dc53717d, 0xaf64998dbf9033624a22db58e5e8d85135277d4f3abf176876c2178c2c4fa8aa),
+    (0x3a6f4c497688a0863f52438edd3a1376a69c77560008abb4c3c2b4127fbef628, 0x796aba23f79973fb5b51a327451251977de645ce5e790b598dca1641126f5476),
+    (0xda7fa95f6eca61940392854401f229926cb9019d031e9f6306129252b78a0575, 0x2c2efedbbbd1985972889d45bc92bc35ac24e5608ec5dca65abf16bb6346268c),
+    (0x569525436f69b4579948cc8c9b5ebee5c8c78f4fcda31e4a89eb1b96d347feca, 0xc670543ebbbbc36e663509a68a9bcb172becf2d43eae86cd6a3b3ef7daa7367a),
+    (0x9c2c62677c775b6b4736603bf591522eb1ac125e376de4ad7b29249628bc89e8, 0x9ddcadc56df16f9086320365e7fbc78f2a626e93dc7ab49bca91de658e2a143b),
+    (0x21ba3c52082e4d79422705c3b34f53213bf11e70eb850dda4131bfd09099b9c9, 0xa2d7916c077cbc91ecfaa6e5729551192e1d8cd45eeb87b876a27c83e427ebe9),
+    (0x3d5929b3976d2d4b2fff27f8b15715125f07093efd43f5ec8cbe4d6e3581c6cd, 0x277fa77bb73f209011451b7897a014f436f4b114f03fcd1e171dc0c200b64b81),
+    (0xc56d84f7a0abcaae14d14d597bcf3d2cd4e8aa74467a04b76fcde854af5cab24, 0x5bff4f05dd3e48fc6b013bc56ddf93a6df5054eb867114f6937608b1e9ec1dd7),
+    (0x71cd2638d119777e7255dc15e775420a8717f1d95d53d5d9a6874da5e8eb9fa6, 0x63b482debf3b82131bf18c1d037ec77b5171c1f76937763bed636262aca9fc16),
+    (0xf46bad95ddb3139961eaa8254ef060b6fae8dd8f7469772e0bc91e667d6de321, 0xb54bb792eddb10a7a79815d86ea52f6811d287d07d09eb1c92708587c21213c9),
+    (0xd20da0111398a20ca3f9a9d0103707cb4b387e0b7fcbeeec2d7c4576636d0ae6, 0x30271d424901dd7d15846d9178baca745cc544d78afbe9cefd1fac7877bb0455),
+    (0xadfceaf681bd04054ea35646493fb0dc55cd3618f4b85d2dee0af6df4b037401, 0x9b4daab191623d28daadd46a639e33d92fe483a7605d3bb9342df99f5b1ddf0d),
+    (0xdcd9f5eb92a40b285c0945c032ed344c4a5ed03572f35b9ce7980bd903c5178a, 0xe12ec09a7bad9a464ab9791cffb0a2843f2bbaf875ddbbba58d2fb9b51e6c89a),
+    (0xebc469d8c264855c44a0c5f6cce017f6222888efb70fba85048df69b0b89d4bd, 0xbae5fb784b12634fe35956d886efe6a924f72349ea5f6aecb6420b9dd7cb56bb),
+    (0x681d6be2b2567ac59de1e8e76080e0f8dadf6dcec6ad55f11bcb36a57bca0bc1, 0x1dfcab92c48087f3263f2166cf14e1b02a6a766ee58790f1deb1edd4763f4fcb),
+    (0xb66344189b23a1d3890e8ba335e974ba68f81bc5a201226fc0c38d52778189c5, 0xc85b3262d1da45586d2992bc8e7a3d5ed7e854a26ca457e47cde9e81da3b7af3),
+    (0xac9d5b235a2cc1f65079da8890638f389c82e92975a1aea232fb658aee5df4eb, 0x6cbb0b448dbb9503ffd2005681769921183b4444e22c0b324c315413a4b6436b),
+    (0xefa5ceeddc2447be9f249e32db0c465c418412258395387361f97d99de1300a9, 0x2b961781c8efd72e90bd6b0300e670fedbf4dded9005b6a49ab30d9a6c191d51),
+    (0x37b726d8c571fb6700744fb880e8987aa9040e464ac5731b02ac361896409eb3, 0xbf0df92f49e1c809a9e01754751b6bebdc59d3230a8ef52a2ad96a5a7d57d0f1),
+    (0x5b8ee3faac3fdf3772ba430f541cb355b47a90047783946ae86e9a3d39f81c9e, 0x59575436ac1d5e95c0d58d9b0a90fb2375429f37d30bc7d3df371fda635ae687),
+    (0x9cba423e5af13ff5081d887c8646fbeceaa6f72508076b0ab5d21d640c6ce683, 0x7562190a2aa017e005af002f15cdf0ae79f3727326c5c7199bb2fc49f54fc3c0),
+    (0x5308b91db4bb2e1ff25592e5640d9419c3cda2ed6292ac2064777efc05a0af19, 0x6b64bf2647c018ab2d50b9afabae0290e4b6bd8ced42874abc5d3721bf1444ce),
+    (0xe9f73a4561ea45a612bd427a1eec566b7d700ee29fd6e193580e9c32b376ce56, 0x76323ee207e4444c58beb1a68384b6ac4a5aa3abdbca1ad255617aa808490971),
+    (0xb2871e1cc3cef1732f67adb0973d58fef7615b0dce1c832de88f54d30c4a3b64, 0xca537a69ef2764c310764c79a435918dd11912b4ab59d53aed83d2a27a97569e),
+    (0xfe17e49fe15c70e53bd55133af58f361b531f3b8e778a78794d56bc890125dee, 0xa55b4f605c274ad043aca5e628f1575f0c5ff33b36ccb9f9dd93b546c6f1d920),
+    (0xacb44d40543db0ef8913e9896176fe56967f03d6560e63635a6fda9d06589232, 0x65271ba16511572ebc3f7e1544a05ad1ab32c974d42959e6ab0e252a8e895b40),
+    (0x0d216a15425d091f15464f306e525d1fef84f18baca75397fcf99e08bcd91c45, 0xce3e7c99c40a8c751768a8b87f5d18f8aab24306674165191f87dcaf0ac21d69),
+    (0x34f06e15c8dea1b66cb479f4c47589cc4f6a034374ac2be84f31f58637b6d3ee, 0x0e04bcc9513a6da1de25a0639ff2123f6989fd6d240fdd1fe091b4dd053e171b),
+    (0x5684a676c5f1c69e44e595ec86a5defc90502cbccb86e63164981b01e9343616, 0x949349c50ac25661331953433d913783a9cd90095ccd436be4b9d8cfc2d85a87),
+    (0xdaf3f4f19bf107063b239e560e25bd0dc5f4cef51ee27deb2be3f5f5564efa22, 0x7ffa38df051194cde06424031e312dcb1bc79c9ebf83cb15788294b55b919a7d),
+]
@@ -0,0 +1,344 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+# distutils: libraries = gmp
+"""
+Compiled core of the Elliptic Curve (EC) point arithmetic on top of GMP.
+
+All intermediate values are kept in `mpz_t` variables, Python ints are converted only at the boundary.
+Points are given in Jacobian coordinates (X, Y, Z) with x = X/Z^2, y = Y/Z^3, the point at infinity is None.
+
+Build in place (needs Cython and the GMP headers):
+$ cythonize -i ec_core.pyx
+
+`ec.Curve.point_mul` uses this module when it can be imported and falls back to pure Python otherwise.
+"""
+
+from libc.stdlib cimport malloc, free
+
+
+cdef extern from "gmp.h":
+    ctypedef struct __mpz_struct:
+        pass
+    ctypedef __mpz_struct mpz_t[1]
+
+    void mpz_init(mpz_t)
+    void mpz_clear(mpz_t)
+    void mpz_set(mpz_t, const mpz_t)
+    void mpz_set_ui(mpz_t, unsigned long)
+    void mpz_add(mpz_t, const mpz_t, const mpz_t)
+    void mpz_sub(mpz_t, const mpz_t, const mpz_t)
+    void mpz_mul(mpz_t, const mpz_t, const mpz_t)
+    void mpz_mul_ui(mpz_t, const mpz_t, unsigned long)
+    void mpz_mod(mpz_t, const mpz_t, const mpz_t)
+    int mpz_invert(mpz_t, const mpz_t, const mpz_t)
+    int mpz_sgn(const mpz_t)
+    int mpz_cmp(const mpz_t, const mpz_t)
+    int mpz_tstbit(const mpz_t, unsigned long)
+    size_t mpz_sizeinbase(const mpz_t, int)
+    void mpz_import(mpz_t, size_t, int, size_t, int, size_t, const void *)
+    void *mpz_export(void *, size_t *, int, size_t, int, size_t, const mpz_t)
+
+
+cdef struct jac_t:
+    mpz_t X
+    mpz_t Y
+    mpz_t Z
+    bint inf
+
+
+cdef struct ctx_t:
+    mpz_t p
+    mpz_t a
+    bint a_minus_3
+    mpz_t t[8]
+
+
+cdef void _set_int(mpz_t r, object v) except *:
+    cdef bytes b = v.to_bytes((v.bit_length() + 7) // 8, "big")
+    mpz_import(r, len(b), 1, 1, 1, 0, <const char *>b)
+
+
+cdef object _get_int(const mpz_t v):
+    cdef size_t count = 0
+    cdef size_t size = (mpz_sizeinbase(v, 2) + 7) // 8
+    cdef unsigned char *buf = <unsigned char *>malloc(size)
+    if buf == NULL:
+        raise MemoryError()
+    try:
+        mpz_export(buf, &count, 1, 1, 1, 0, v)
+        return int.from_bytes(buf[:count], "big")
+    finally:
+        free(buf)
+
+
+cdef void _ctx_init(ctx_t *c, object p, object a) except *:
+    cdef int i
+    mpz_init(c.p)
+    mpz_init(c.a)
+    for i in range(8):
+        mpz_init(c.t[i])
+    _set_int(c.p, p)
+    _set_int(c.a, a % p)
+    c.a_minus_3 = (a % p) == p - 3
+
+
+cdef void _ctx_clear(ctx_t *c):
+    cdef int i
+    mpz_clear(c.p)
+    mpz_clear(c.a)
+    for i in range(8):
+        mpz_clear(c.t[i])
+
+
+cdef void _jac_init(jac_t *r):
+    mpz_init(r.X)
+    mpz_init(r.Y)
+    mpz_init(r.Z)
+    r.inf = True
+
+
+cdef void _jac_clear(jac_t *r):
+    mpz_clear(r.X)
+    mpz_clear(r.Y)
+    mpz_clear(r.Z)
+
+
+cdef void _jac_copy(jac_t *r, const jac_t *q):
+    mpz_set(r.X, q.X)
+    mpz_set(r.Y, q.Y)
+    mpz_set(r.Z, q.Z)
+    r.inf = q.inf
+
+
+cdef void _jac_set(jac_t *r, object pt) except *:
+    if pt is None:
+        r.inf = True
+        return
+    _set_int(r.X, pt[0])
+    _set_int(r.Y, pt[1])
+    _set_int(r.Z, pt[2])
+    r.inf = False
+
+
+cdef object _jac_get(jac_t *r):
+    if r.inf:
+        return None
+    return (_get_int(r.X), _get_int(r.Y), _get_int(r.Z))
+
+
+cdef void _double(ctx_t *c, jac_t *r):
+    """r = 2 * r"""
+    cdef __mpz_struct *YY = c.t[0]
+    cdef __mpz_struct *ZZ = c.t[1]
+    cdef __mpz_struct *S = c.t[2]
+    cdef __mpz_struct *M = c.t[3]
+    cdef __mpz_struct *u = c.t[4]
+    cdef __mpz_struct *v = c.t[5]
+
+    if r.inf or mpz_sgn(r.Y) == 0:
+        r.inf = True
+        return
+
+    mpz_mul(YY, r.Y, r.Y)
+    mpz_mod(YY, YY, c.p)
+    mpz_mul(ZZ, r.Z, r.Z)
+    mpz_mod(ZZ, ZZ, c.p)
+
+    # S = 4 * X * YY
+    mpz_mul(S, r.X, YY)
+    mpz_mul_ui(S, S, 4)
+    mpz_mod(S, S, c.p)
+
+    if c.a_minus_3:
+        # M = 3 * (X - ZZ) * (X + ZZ)
+        mpz_sub(u, r.X, ZZ)
+        mpz_add(v, r.X, ZZ)
+        mpz_mul(M, u, v)
+        mpz_mul_ui(M, M, 3)
+    else:
+        # M = 3 * X^2 + a * ZZ^2
+        mpz_mul(M, r.X, r.X)
+        mpz_mul_ui(M, M, 3)
+        mpz_mul(u, ZZ, ZZ)
+        mpz_mod(u, u, c.p)
+        mpz_mul(u, u, c.a)
+        mpz_add(M, M, u)
+    mpz_mod(M, M, c.p)
+
+    # Z' = 2 * Y * Z
+    mpz_mul(r.Z, r.Y, r.Z)
+    mpz_mul_ui(r.Z, r.Z, 2)
+    mpz_mod(r.Z, r.Z, c.p)
+
+    # X' = M^2 - 2 * S
+    mpz_mul(r.X, M, M)
+    mpz_sub(r.X, r.X, S)
+    mpz_sub(r.X, r.X, S)
+    mpz_mod(r.X, r.X, c.p)
+
+    # Y' = M * (S - X') - 8 * YY^2
+    mpz_sub(u, S, r.X)
+    mpz_mul(u, M, u)
+    mpz_mul(v, YY, YY)
+    mpz_mul_ui(v, v, 8)
+    mpz_sub(r.Y, u, v)
+    mpz_mod(r.Y, r.Y, c.p)
+
+
+cdef void _add(ctx_t *c, jac_t *r, const jac_t *q):
+    """r = r + q"""
+    cdef __mpz_struct *U1 = c.t[0]
+    cdef __mpz_struct *U2 = c.t[1]
+    cdef __mpz_struct *S1 = c.t[2]
+    cdef __mpz_struct *S2 = c.t[3]
+    cdef __mpz_struct *H = c.t[4]
+    cdef __mpz_struct *R = c.t[5]
+    cdef __mpz_struct *u = c.t[6]
+    cdef __mpz_struct *v = c.t[7]
+
+    if q.inf:
+        return
+    if r.inf:
+        _jac_copy(r, q)
+        return
+
+    # U2 = X2 * Z1^2, S2 = Y2 * Z1^3
+    mpz_mul(u, r.Z, r.Z)
+    mpz_mod(u, u, c.p)
+    mpz_mul(U2, q.X, u)
+    mpz_mod(U2, U2, c.p)
+    mpz_mul(u, u, r.Z)
+    mpz_mul(S2, q.Y, u)
+    mpz_mod(S2, S2, c.p)
+
+    # U1 = X1 * Z2^2, S1 = Y1 * Z2^3
+    mpz_mul(u, q.Z, q.Z)
+    mpz_mod(u, u, c.p)
+    mpz_mul(U1, r.X, u)
+    mpz_mod(U1, U1, c.p)
+    mpz_mul(u, u, q.Z)
+    mpz_mul(S1, r.Y, u)
+    mpz_mod(S1, S1, c.p)
+
+    mpz_sub(H, U2, U1)
+    mpz_mod(H, H, c.p)
+    mpz_sub(R, S2, S1)
+    mpz_mod(R, R, c.p)
+
+    if mpz_sgn(H) == 0:
+        if mpz_sgn(R) == 0:
+            _double(c, r)
+        else:
+            r.inf = True
+        return
+
+    # Z3 = Z1 * Z2 * H
+    mpz_mul(r.Z, r.Z, q.Z)
+    mpz_mod(r.Z, r.Z, c.p)
+    mpz_mul(r.Z, r.Z, H)
+    mpz_mod(r.Z, r.Z, c.p)
+
+    # u = H^2, H = H^3, v = U1 * H^2
+    mpz_mul(u, H, H)
+    mpz_mod(u, u, c.p)
+    mpz_mul(H, H, u)
+    mpz_mod(H, H, c.p)
+    mpz_mul(v, U1, u)
+    mpz_mod(v, v, c.p)
+
+    # X3 = R^2 - H^3 - 2 * V
+    mpz_mul(r.X, R, R)
+    mpz_sub(r.X, r.X, H)
+    mpz_sub(r.X, r.X, v)
+    mpz_sub(r.X, r.X, v)
+    mpz_mod(r.X, r.X, c.p)
+
+    # Y3 = R * (V - X3) - S1 * H^3
+    mpz_sub(v, v, r.X)
+    mpz_mul(v, R, v)
+    mpz_mul(u, S1, H)
+    mpz_sub(r.Y, v, u)
+    mpz_mod(r.Y, r.Y, c.p)
+
+
+def point_double_jac(p, a, pt):
+    """
+    Double a point given in Jacobian coordinates over the curve y^2 = x^3 + ax + b (mod p).
+    """
+    cdef ctx_t c
+    cdef jac_t r
+    _ctx_init(&c, p, a)
+    _jac_init(&r)
+    try:
+        _jac_set(&r, pt)
+        _double(&c, &r)
+        return _jac_get(&r)
+    finally:
+        _jac_clear(&r)
+        _ctx_clear(&c)
+
+
+def point_add_jac(p, a, pt1, pt2):
+    """
+    Add two points given in Jacobian coordinates over the curve y^2 = x^3 + ax + b (mod p).
+    """
+    cdef ctx_t c
+    cdef jac_t r, q
+    _ctx_init(&c, p, a)
+    _jac_init(&r)
+    _jac_init(&q)
+    try:
+        _jac_set(&r, pt1)
+        _jac_set(&q, pt2)
+        _add(&c, &r, &q)
+        return _jac_get(&r)
+    finally:
+        _jac_clear(&q)
+        _jac_clear(&r)
+        _ctx_clear(&c)
+
+
+def point_mul(p, a, k, x, y, long nbits):
+    """
+    Multiply the affine point (x, y) by the scalar k with the Montgomery ladder over `nbits` bits.
+
+    Returns the affine result, or None for the point at infinity.
+    """
+    cdef ctx_t c
+    cdef jac_t r0, r1
+    cdef mpz_t kk
+    cdef long i
+    _ctx_init(&c, p, a)
+    _jac_init(&r0)
+    _jac_init(&r1)
+    mpz_init(kk)
+    try:
+        _set_int(kk, k)
+        _jac_set(&r1, (x, y, 1))
+
+        for i in range(nbits - 1, -1, -1):
+            if mpz_tstbit(kk, i):
+                _add(&c, &r0, &r1)
+                _double(&c, &r1)
+            else:
+                _add(&c, &r1, &r0)
+                _double(&c, &r0)
+
+        if r0.inf:
+            return None
+
+        # x = X / Z^2, y = Y / Z^3
+        mpz_invert(c.t[0], r0.Z, c.p)
+        mpz_mul(c.t[1], c.t[0], c.t[0])
+        mpz_mod(c.t[1], c.t[1], c.p)
+        mpz_mul(c.t[2], r0.X, c.t[1])
+        mpz_mod(c.t[2], c.t[2], c.p)
+        mpz_mul(c.t[1], c.t[1], c.t[0])
+        mpz_mod(c.t[1], c.t[1], c.p)
+        mpz_mul(c.t[3], r0.Y, c.t[1])
+        mpz_mod(c.t[3], c.t[3], c.p)
+        return (_get_int(c.t[2]), _get_int(c.t[3]))
+    finally:
+        mpz_clear(kk)
+        _jac_clear(&r1)
+        _jac_clear(&r0)
+        _ctx_clear(&c)
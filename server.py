@@ -27,7 +27,7 @@ The server should *not* output anything to the standard output, only to the afor
 import socket
 import argparse
 from ec import curve_secp256r1
-from common import p, g, dh_hash_pub, debug_log, HOST, dh_gen_priv
+from common import P_MPZ, G_MPZ, to_mpz, mpz_from_bytes, dh_hash_pub, debug_log, HOST, dh_gen_priv, powmod, PLEN, recv_exact, write_keys
 
 parser = argparse.ArgumentParser(prog="server.py", description="server for DH/ECDH key exchange")
 parser.add_argument("-p", "--port", required=True)
@@ -41,41 +41,35 @@ PORT = int(args.port)
 def ecdh(conn: socket.socket):
     with conn:
         s_priv, s_pub = curve_secp256r1.generate_keys()
-        data = conn.recv(1024)
-        c_pub = curve_secp256r1.decode_pub(data)
-        pub_enc = curve_secp256r1.encode_pub(s_pub)
+        pub_enc = curve_secp256r1.encode_pub_compressed(s_pub)
+        data = recv_exact(conn, len(pub_enc))
+        c_pub = curve_secp256r1.decode_pub_compressed(data)
         conn.sendall(pub_enc)
         shared = curve_secp256r1.point_mul(s_priv, c_pub)
-        debug_log(args, curve_secp256r1.hash_pub(shared))
-        with open("server.priv", "w") as f:
-            f.write(str(s_priv))
-        with open("server.pub", "w") as f:
-            pub_dict = dict(x = s_pub[0], y = s_pub[1])
-            f.write(str(pub_dict))
-        with open("server.shared", "w") as f:
-            f.write(curve_secp256r1.hash_pub(shared))
+        shared_hash = curve_secp256r1.hash_pub(shared)
+        debug_log(args, shared_hash)
+        pub_dict = dict(x = s_pub[0], y = s_pub[1])
+        write_keys("server", str(s_priv), str(pub_dict), shared_hash)
 
 def dh(conn: socket.socket):
     with conn:
         s_priv = dh_gen_priv()
-        s_pub = pow(g, s_priv, p)
-        data = conn.recv(8192)
-        conn.sendall(s_pub.to_bytes(8192, "big"))
-        c_pub = int.from_bytes(data, "big")
-        shared = pow(c_pub, s_priv, p)
-        debug_log(args, dh_hash_pub(shared))
-        with open("server.priv", "w") as f:
-            f.write(str(s_priv))
-        with open("server.pub", "w") as f:
-            f.write(str(s_pub))
-        with open("server.shared", "w") as f:
-            f.write(dh_hash_pub(shared))
+        s_priv_mpz = to_mpz(s_priv)
+        s_pub = powmod(G_MPZ, s_priv_mpz, P_MPZ)
+        data = recv_exact(conn, PLEN)
+        conn.sendall(s_pub.to_bytes(PLEN, "big"))
+        c_pub = mpz_from_bytes(data)
+        shared = powmod(c_pub, s_priv_mpz, P_MPZ)
+        shared_hash = dh_hash_pub(shared)
+        debug_log(args, shared_hash)
+        write_keys("server", str(s_priv), str(s_pub), shared_hash)
 
 with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
     s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
     s.bind((HOST, PORT))
     s.listen()
     conn, addr = s.accept()
+    conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
     if args.ec:
         ecdh(conn)
     else: